@@ -3,17 +3,89 @@
 import sys
 import numpy as np
 from scipy import signal
-from scipy.io import wavfile
-import pygame
-import tempfile
+import threading
 import os
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# The render geometry never changes at runtime, so fix it in module
+# constants; the numba kernels below specialize on the exact lengths.
+# The stream callback loops the buffer forever — for broadband noise a
+# 12s segment with a 3s crossfade hides the period as well as 60s did.
+FS = 44100
+DURATION = 12
+OVERLAP = 3  # Overlap in seconds for crossfade
+N_RAW = (DURATION + OVERLAP) * FS
+LOOP_LEN = DURATION * FS
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                             QSlider, QLabel, QPushButton, QLineEdit, QHBoxLayout,
                             QMenu, QStyle, QSystemTrayIcon, QMenuBar, QMessageBox)
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
 from PyQt6.QtGui import QIcon, QPalette, QColor
 from PyQt6.QtCore import QSettings
 
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _pink_kellet(white, out):
+        # Paul Kellet's refined pink filter as one fused loop; the seven
+        # filter registers live entirely in machine registers
+        b0 = b1 = b2 = b3 = b4 = b5 = b6 = 0.0
+        for i in range(white.size):
+            w = white[i]
+            b0 = 0.99886 * b0 + w * 0.0555179
+            b1 = 0.99332 * b1 + w * 0.0750759
+            b2 = 0.96900 * b2 + w * 0.1538520
+            b3 = 0.86650 * b3 + w * 0.3104856
+            b4 = 0.55000 * b4 + w * 0.5329522
+            b5 = -0.7616 * b5 - w * 0.0168980
+            out[i] = b0 + b1 + b2 + b3 + b4 + b5 + b6 + w * 0.5362
+            b6 = w * 0.115926
+        return out
+
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _mix_sources(mat, rows, vols, mix):
+        # Fused mix of the active source rows in one parallel sweep; the
+        # buffer length is baked in at compile time via N_RAW
+        for i in prange(N_RAW):
+            acc = np.float32(0.0)
+            for s in range(rows.size):
+                acc += mat[rows[s], i] * vols[s]
+            mix[i] = acc
+else:
+    _pink_kellet = None
+    _mix_sources = None
+
+# Remix tile length: 64k float32 samples (~256 KB) stays resident in
+# L2/L3 between the volume scaling and the notch pass
+_TILE = 65536
+
+_fade_ramps = {}
+
+def fade_ramps(n):
+    # Crossfade ramps computed once per overlap length
+    if n not in _fade_ramps:
+        _fade_ramps[n] = (np.linspace(1, 0, n, dtype=np.float32),
+                          np.linspace(0, 1, n, dtype=np.float32))
+    return _fade_ramps[n]
+
+class NoiseWorkerSignals(QObject):
+    finished = pyqtSignal(int, object)  # job seq id, int16 buffer
+
+class NoiseWorker(QRunnable):
+    # Runs generate_noise off the GUI thread so sliders stay responsive
+    def __init__(self, window, seq):
+        super().__init__()
+        self.window = window
+        self.seq = seq
+        self.signals = NoiseWorkerSignals()
+
+    def run(self):
+        noise, fs = self.window.generate_noise()
+        self.signals.finished.emit(self.seq, noise)
+
 class TinnitusTamer(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -23,14 +95,14 @@ class TinnitusTamer(QMainWindow):
         # Settings for persistence
         self.settings = QSettings("xAI", "TinnitusTamer")
         
-        # Initialize pygame mixer with explicit parameters
-        try:
-            pygame.mixer.pre_init(frequency=44100, size=-16, channels=1, buffer=4096)
-            pygame.mixer.init()
-            print("Pygame mixer initialized successfully")
-        except Exception as e:
-            print(f"Failed to initialize pygame mixer: {e}")
-        
+        # Audio output: a persistent sounddevice stream pulls blocks from
+        # the current loop buffer in _audio_callback, so parameter changes
+        # just swap the buffer pointer instead of reloading a Sound
+        self._stream = None
+        self._buffer_lock = threading.Lock()
+        self._loop_buffer = None
+        self._play_pos = 0
+
         # Variables (load from settings)
         self.white_vol = self.settings.value("white_vol", 0.5, float)
         self.pink_vol = self.settings.value("pink_vol", 0.0, float)
@@ -42,9 +114,45 @@ class TinnitusTamer(QMainWindow):
         self.tinnitus_freq = self.settings.value("tinnitus_freq", 4000.0, float)
         self.notch_q = self.settings.value("notch_q", 30.0, float)
         self.playing = False
-        self.sound = None
-        self.tmpfile = None
-        
+
+        # Warm up the JIT kernels so the first Play doesn't pay the compile
+        if _pink_kellet is not None:
+            _pink_kellet(np.zeros(1, dtype=np.float32), np.zeros(1, dtype=np.float32))
+        if _mix_sources is not None:
+            # The mix kernel always sweeps the full N_RAW, so warm it up
+            # with an empty source set and a real-sized output buffer
+            _mix_sources(np.empty((1, 1), dtype=np.float32),
+                         np.empty(0, dtype=np.int64),
+                         np.empty(0, dtype=np.float32),
+                         np.empty(N_RAW, dtype=np.float32))
+
+        # PCG64 generator; the legacy np.random global is ~2x slower for
+        # large Gaussian draws and can't draw float32 directly
+        self._rng = np.random.default_rng()
+
+        # Cached per-source noise buffers and notch design, so slider
+        # changes only remix/re-filter instead of regenerating everything
+        self._cache = {}
+        self._sources_mat = None
+        self._notch_sos = None
+        self._notch_key = None
+
+        # Sticky scratch buffers reused by every rebuild, so slider drags
+        # don't churn the allocator with multi-MB temporaries
+        self._scratch = {}
+
+        # Single worker thread: jobs share the scratch buffers above, and
+        # serializing them means the newest job always writes last
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._job_seq = 0
+
+        # Coalesce bursts of slider events into a single rebuild
+        self._rebuild_timer = QTimer(self)
+        self._rebuild_timer.setSingleShot(True)
+        self._rebuild_timer.setInterval(150)
+        self._rebuild_timer.timeout.connect(self._rebuild_sound)
+
         # GUI setup
         self.init_ui()
         
@@ -165,12 +273,15 @@ class TinnitusTamer(QMainWindow):
         """)
         
         # Sliders and labels
-        self.add_slider(layout, "White Noise Volume", 0, 100, int(self.white_vol * 100), self.update_white_vol)
-        self.add_slider(layout, "Pink Noise Volume", 0, 100, int(self.pink_vol * 100), self.update_pink_vol)
-        self.add_slider(layout, "Brown Noise Volume", 0, 100, int(self.brown_vol * 100), self.update_brown_vol)
-        self.add_slider(layout, "Wind Volume", 0, 100, int(self.wind_vol * 100), self.update_wind_vol)
-        self.add_slider(layout, "Ocean Waves Volume", 0, 100, int(self.ocean_vol * 100), self.update_ocean_vol)
-        self.add_slider(layout, "Waterfall Volume", 0, 100, int(self.waterfall_vol * 100), self.update_waterfall_vol)
+        # Noise volumes rebuild the loop, so only fire them on release;
+        # master volume is applied live in the audio callback and stays
+        # tracking for immediate feedback
+        self.add_slider(layout, "White Noise Volume", 0, 100, int(self.white_vol * 100), self.update_white_vol, tracking=False)
+        self.add_slider(layout, "Pink Noise Volume", 0, 100, int(self.pink_vol * 100), self.update_pink_vol, tracking=False)
+        self.add_slider(layout, "Brown Noise Volume", 0, 100, int(self.brown_vol * 100), self.update_brown_vol, tracking=False)
+        self.add_slider(layout, "Wind Volume", 0, 100, int(self.wind_vol * 100), self.update_wind_vol, tracking=False)
+        self.add_slider(layout, "Ocean Waves Volume", 0, 100, int(self.ocean_vol * 100), self.update_ocean_vol, tracking=False)
+        self.add_slider(layout, "Waterfall Volume", 0, 100, int(self.waterfall_vol * 100), self.update_waterfall_vol, tracking=False)
         self.add_slider(layout, "Master Volume", 0, 100, int(self.master_vol * 100), self.update_master_vol)
         
         # Tinnitus frequency input
@@ -183,7 +294,7 @@ class TinnitusTamer(QMainWindow):
         layout.addLayout(freq_layout)
         
         # Notch Q slider
-        self.add_slider(layout, "Notch Q (higher = narrower)", 1, 100, int(self.notch_q), self.update_notch_q)
+        self.add_slider(layout, "Notch Q (higher = narrower)", 1, 100, int(self.notch_q), self.update_notch_q, tracking=False)
         
         # Play/Stop button
         self.play_button = QPushButton("Play")
@@ -216,13 +327,16 @@ class TinnitusTamer(QMainWindow):
         """
         QMessageBox.about(self, "About Tinnitus Tamer", about_text)
 
-    def add_slider(self, layout, label, min_val, max_val, default, callback):
+    def add_slider(self, layout, label, min_val, max_val, default, callback, tracking=True):
         slider_layout = QHBoxLayout()
         slider_label = QLabel(label)
         slider = QSlider(Qt.Horizontal)
         slider.setMinimum(min_val)
         slider.setMaximum(max_val)
         slider.setValue(default)
+        # tracking=False defers valueChanged to slider release, so sliders
+        # that trigger a rebuild don't fire on every pixel of a drag
+        slider.setTracking(tracking)
         slider.valueChanged.connect(callback)
         slider_layout.addWidget(slider_label)
         slider_layout.addWidget(slider)
@@ -259,11 +373,10 @@ class TinnitusTamer(QMainWindow):
         self.update_sound()
 
     def update_master_vol(self, value):
+        # Applied live by the audio callback, no rebuild needed
         self.master_vol = value / 100.0
         self.settings.setValue("master_vol", self.master_vol)
-        if self.sound:
-            self.sound.set_volume(self.master_vol)
-            print(f"Master volume set to {self.master_vol}")
+        print(f"Master volume set to {self.master_vol}")
 
     def update_freq(self, text):
         try:
@@ -279,94 +392,214 @@ class TinnitusTamer(QMainWindow):
         self.settings.setValue("notch_q", self.notch_q)
         self.update_sound()
 
-    def generate_noise(self):
-        fs = 44100
-        duration = 60  # Longer duration for less frequent looping
-        overlap = 3  # Overlap in seconds for crossfade
-        N_raw = int((duration + overlap) * fs)
+    def _generate_sources(self, N_raw, fs, volumes):
+        # Build the unit-variance source buffers once and cache them;
+        # volume changes only need a remix, not a regeneration. Sources
+        # sitting at volume 0 are never generated at all.
+        cache = self._cache
+        if self._sources_mat is None:
+            # One matrix row per source, handed out in generation order;
+            # cache values are views into it, and the mix kernel can
+            # gather just the active rows by index
+            self._sources_mat = np.empty((6, N_raw), dtype=np.float32)
+
+        def store(name, data):
+            row = self._sources_mat[len(cache)]
+            np.copyto(row, data)
+            cache[name] = row
+            return row
 
         # Generate base noises
         def generate_white(N):
-            return np.random.randn(N)
-
-        def generate_colored(beta, N, fs):
-            white = generate_white(N)
-            fft_white = np.fft.rfft(white)
-            freqs = np.fft.rfftfreq(N, 1/fs)
-            freqs[freqs == 0] = 1e-10  # Avoid division by zero
-            magnitude = 1 / (freqs ** (beta / 2))
-            colored_fft = fft_white * magnitude
-            colored = np.fft.irfft(colored_fft)
-            colored -= np.mean(colored)  # Remove DC offset
-            std = np.std(colored)
-            if std > 1e-10:
-                colored /= std  # Normalize to unit variance
-            return colored
+            # Drawing float32 directly skips the float64 draw + cast
+            return self._rng.standard_normal(N, dtype=np.float32)
 
-        # Additional sound generators
-        def generate_wind(N, fs):
-            brown = generate_colored(2, N, fs)
-            b, a = signal.butter(2, 500 / (fs / 2), 'low')
-            wind = signal.filtfilt(b, a, brown)
-            wind -= np.mean(wind)
-            std = np.std(wind)
+        def normalize(x):
+            x -= np.mean(x)  # Remove DC offset
+            std = np.std(x)
             if std > 1e-10:
-                wind /= std
-            return wind
+                x /= std  # Normalize to unit variance
+            return x
+
+        def generate_pink(white):
+            # Paul Kellet's refined pink filter: a bank of parallel one-pole
+            # IIR sections approximating a 1/f spectrum in a single pass,
+            # without FFT-sized scratch buffers
+            if _pink_kellet is not None:
+                pink = _pink_kellet(white, np.empty_like(white))
+            else:
+                poles = (0.99886, 0.99332, 0.96900, 0.86650, 0.55000, -0.7616)
+                gains = (0.0555179, 0.0750759, 0.1538520, 0.3104856, 0.5329522, -0.0168980)
+                pink = white * 0.5362
+                for gain, pole in zip(gains, poles):
+                    b = np.array([gain], dtype=np.float32)
+                    a = np.array([1.0, -pole], dtype=np.float32)
+                    pink += signal.lfilter(b, a, white)
+                pink[1:] += 0.115926 * white[:-1]
+            return normalize(pink)
+
+        def generate_brown(white):
+            # Leaky integrator over white noise: a random walk whose drift
+            # decays instead of wandering off to infinity
+            b = np.array([1.0], dtype=np.float32)
+            a = np.array([1.0, -0.995], dtype=np.float32)
+            brown = signal.lfilter(b, a, white)
+            return normalize(brown)
 
-        def generate_ocean(N, fs):
-            pink = generate_colored(1, N, fs)
-            t = np.arange(N) / fs
-            modulation = 0.5 + 0.5 * np.sin(2 * np.pi * 0.1 * t)  # slow swell
+        # Additional sound generators
+        def generate_wind(brown, fs):
+            # One-pass causal filter; zero phase buys nothing audible on a
+            # pre-rendered loop and filtfilt doubles the work
+            sos = signal.butter(2, 500 / (fs / 2), 'low', output='sos').astype(np.float32)
+            wind = signal.sosfilt(sos, brown)
+            return normalize(wind)
+
+        def generate_ocean(pink, fs):
+            N = len(pink)
+            # The 0.1 Hz swell repeats every 10s, so evaluate sin over a
+            # single period and tile it instead of over the whole buffer
+            period = 10 * fs
+            t = np.arange(period, dtype=np.float32) / fs
+            one_cycle = 0.5 + 0.5 * np.sin(2 * np.pi * 0.1 * t)
+            modulation = np.tile(one_cycle, -(-N // period))[:N]
             ocean = pink * modulation
-            ocean -= np.mean(ocean)
-            std = np.std(ocean)
-            if std > 1e-10:
-                ocean /= std
-            return ocean
+            return normalize(ocean)
 
-        def generate_waterfall(N, fs):
-            pink = generate_colored(1, N, fs)
-            white = generate_colored(0, N, fs)
+        def generate_waterfall(pink, white, fs):
             waterfall = 0.7 * pink + 0.3 * white
-            b, a = signal.butter(2, 200 / (fs / 2), 'high')
-            waterfall = signal.filtfilt(b, a, waterfall)
-            waterfall -= np.mean(waterfall)
-            std = np.std(waterfall)
-            if std > 1e-10:
-                waterfall /= std
-            return waterfall
-
-        white = generate_colored(0, N_raw, fs) * self.white_vol
-        pink = generate_colored(1, N_raw, fs) * self.pink_vol
-        brown = generate_colored(2, N_raw, fs) * self.brown_vol
-        wind = generate_wind(N_raw, fs) * self.wind_vol
-        ocean = generate_ocean(N_raw, fs) * self.ocean_vol
-        waterfall = generate_waterfall(N_raw, fs) * self.waterfall_vol
-
-        mix = white + pink + brown + wind + ocean + waterfall
-        if np.abs(mix).max() > 0:
-            mix /= np.abs(mix).max()
-
-        # Apply notch filter if frequency is set
-        if self.tinnitus_freq > 0:
-            w0 = self.tinnitus_freq / (fs / 2.0)
-            b, a = signal.iirnotch(w0, self.notch_q)
-            mix = signal.filtfilt(b, a, mix)
+            sos = signal.butter(2, 200 / (fs / 2), 'high', output='sos').astype(np.float32)
+            waterfall = signal.sosfilt(sos, waterfall)
+            return normalize(waterfall)
+
+        # Each base noise is generated at most once and reused by the
+        # derived sources instead of regenerating from scratch
+        def white_src():
+            if 'white' not in cache:
+                store('white', generate_white(N_raw))
+            return cache['white']
+
+        def pink_src():
+            if 'pink' not in cache:
+                store('pink', generate_pink(white_src()))
+            return cache['pink']
+
+        def brown_src():
+            if 'brown' not in cache:
+                store('brown', generate_brown(white_src()))
+            return cache['brown']
+
+        builders = {
+            'white': white_src,
+            'pink': pink_src,
+            'brown': brown_src,
+            'wind': lambda: store('wind', generate_wind(brown_src(), fs)),
+            'ocean': lambda: store('ocean', generate_ocean(pink_src(), fs)),
+            'waterfall': lambda: store('waterfall', generate_waterfall(pink_src(), white_src(), fs)),
+        }
+        for name, vol in volumes.items():
+            if vol > 0 and name not in cache:
+                builders[name]()
+        return cache
+
+    def _notch_design(self, fs):
+        # Reuse the SOS design until the frequency or Q actually changes
+        key = (self.tinnitus_freq, self.notch_q)
+        if key != self._notch_key:
+            # Direct biquad design: zeros on the unit circle at the tinnitus
+            # frequency, poles just inside at a radius set by the Q, with the
+            # numerator scaled for unity gain at DC. One SOS section, no
+            # iirnotch/tf2sos round-trip through polynomial form.
+            w = 2 * np.pi * self.tinnitus_freq / fs
+            r = max(0.0, 1.0 - (w / self.notch_q) / 2.0)
+            c = np.cos(w)
+            g = (1.0 - 2.0 * r * c + r * r) / (2.0 - 2.0 * c)
+            self._notch_sos = np.array(
+                [[g, -2.0 * g * c, g, 1.0, -2.0 * r * c, r * r]],
+                dtype=np.float32)
+            self._notch_key = key
+        return self._notch_sos
+
+    def generate_noise(self):
+        volumes = {
+            'white': self.white_vol,
+            'pink': self.pink_vol,
+            'brown': self.brown_vol,
+            'wind': self.wind_vol,
+            'ocean': self.ocean_vol,
+            'waterfall': self.waterfall_vol,
+        }
+        sources = self._generate_sources(N_RAW, FS, volumes)
+
+        if self._scratch.get('n') != N_RAW:
+            self._scratch = {
+                'n': N_RAW,
+                'mix': np.empty(N_RAW, dtype=np.float32),
+                'scaled': np.empty(_TILE, dtype=np.float32),
+                'loop': np.empty(LOOP_LEN, dtype=np.float32),
+                'out': np.empty(LOOP_LEN, dtype=np.int16),
+            }
+
+        active = [(name, vol) for name, vol in volumes.items() if vol > 0]
+        mix = self._scratch['mix']
+        # The notch only exists for frequencies below Nyquist: at 0 or a
+        # multiple of FS the unity-DC-gain term divides by zero (NaN
+        # output), and anything past FS/2 would alias the notch onto the
+        # wrong frequency. Out-of-range input just disables the notch,
+        # matching how the old iirnotch ValueError path behaved.
+        in_band = 0 < self.tinnitus_freq < FS / 2
+        sos = self._notch_design(FS) if in_band else None
+        if _mix_sources is not None:
+            # Specialized parallel kernel: one fused sweep over the active
+            # source rows with the buffer length compiled in
+            order = list(sources)
+            rows = np.array([order.index(name) for name, _ in active], dtype=np.int64)
+            vols = np.array([vol for _, vol in active], dtype=np.float32)
+            _mix_sources(self._sources_mat, rows, vols, mix)
+            if sos is not None:
+                mix[:] = signal.sosfilt(sos, mix)
+        else:
+            # Fallback: accumulate only the audible sources, in place,
+            # working through the buffer in cache-sized tiles so each tile
+            # is scaled, summed and notch-filtered while still hot. The
+            # notch state is carried across tiles, so the output matches a
+            # single full-buffer pass.
+            scaled = self._scratch['scaled']
+            zi = np.zeros((1, 2), dtype=np.float32) if sos is not None else None
+            for start in range(0, N_RAW, _TILE):
+                end = min(start + _TILE, N_RAW)
+                tile = mix[start:end]
+                tile.fill(0.0)
+                tile_scaled = scaled[:end - start]
+                for name, vol in active:
+                    np.multiply(sources[name][start:end], vol, out=tile_scaled)
+                    np.add(tile, tile_scaled, out=tile)
+                if sos is not None:
+                    tile[:], zi = signal.sosfilt(sos, tile, zi=zi)
 
         # Create seamless loop with crossfade
-        L = int(duration * fs)
-        O_samples = int(overlap * fs)
-        loop_mix = mix[:L].copy()
-        next_segment = mix[L : L + O_samples]
-        fade_out = np.linspace(1, 0, O_samples)
-        fade_in = np.linspace(0, 1, O_samples)
-        loop_mix[-O_samples:] *= fade_out
-        loop_mix[-O_samples:] += next_segment * fade_in
-
-        # Convert to int16
-        loop_mix = (loop_mix * 32767).astype(np.int16)
-        return loop_mix, fs
+        O_samples = OVERLAP * FS
+        loop_mix = self._scratch['loop']
+        np.copyto(loop_mix, mix[:LOOP_LEN])
+        next_segment = mix[LOOP_LEN : LOOP_LEN + O_samples]
+        fade_out, fade_in = fade_ramps(O_samples)
+        # Fade both segments in place (next_segment is a view into the mix
+        # scratch, which is refilled on the next rebuild anyway)
+        tail = loop_mix[-O_samples:]
+        np.multiply(tail, fade_out, out=tail)
+        np.multiply(next_segment, fade_in, out=next_segment)
+        np.add(tail, next_segment, out=tail)
+
+        # The sources are unit variance, so 3 sigma of the summed volumes
+        # bounds the mix amplitude analytically; folding that into the
+        # int16 scaling replaces the abs/max/divide passes of a measured
+        # peak normalization. The clip catches the rare >3 sigma sample
+        # that would otherwise wrap around in the integer cast.
+        scale = 32767.0 / (3.0 * max(1e-9, sum(volumes.values())))
+        np.multiply(loop_mix, scale, out=loop_mix)
+        np.clip(loop_mix, -32767.0, 32767.0, out=loop_mix)
+        out = self._scratch['out']
+        np.copyto(out, loop_mix, casting='unsafe')
+        return out, FS
 
     def toggle_play(self):
         if self.playing:
@@ -380,46 +613,79 @@ class TinnitusTamer(QMainWindow):
             self.playing = True
             print("Sound started")
 
+    def _audio_callback(self, outdata, frames, time_info, status):
+        if status:
+            print(f"Audio stream status: {status}")
+        out = outdata[:, 0]
+        with self._buffer_lock:
+            buf = self._loop_buffer
+            if buf is None:
+                out.fill(0)
+                return
+            n = len(buf)
+            pos = self._play_pos
+            filled = 0
+            while filled < frames:
+                take = min(frames - filled, n - pos)
+                out[filled:filled + take] = buf[pos:pos + take]
+                pos = (pos + take) % n
+                filled += take
+            self._play_pos = pos
+        if self.master_vol < 1.0:
+            np.multiply(out, self.master_vol, out=out, casting='unsafe')
+
+    def _ensure_stream(self):
+        if self._stream is None:
+            # Importing sounddevice initializes PortAudio and probes the
+            # audio devices, so defer it until the user actually hits Play
+            import sounddevice as sd
+            self._stream = sd.OutputStream(
+                samplerate=44100, channels=1, blocksize=1024,
+                dtype='int16', callback=self._audio_callback)
+        if not self._stream.active:
+            self._stream.start()
+
     def play_sound(self):
-        self.stop_sound()  # Ensure clean state
-        noise, fs = self.generate_noise()
-        
-        # Create temporary WAV file
-        self.tmpfile = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
+        # Hand generation to the worker pool; the old sound keeps playing
+        # until its replacement is ready
+        self._job_seq += 1
+        worker = NoiseWorker(self, self._job_seq)
+        worker.signals.finished.connect(self._on_noise_ready)
+        self._pool.start(worker)
+
+    def _on_noise_ready(self, seq, noise):
+        if seq != self._job_seq or not self.playing:
+            return  # stale job from an earlier slider position
         try:
-            wavfile.write(self.tmpfile.name, fs, noise)
-            print(f"WAV file created: {self.tmpfile.name}")
-            
-            # Load and play sound
-            self.sound = pygame.mixer.Sound(self.tmpfile.name)
-            self.sound.set_volume(self.master_vol)
-            self.sound.play(loops=-1)
-            print("Sound playing")
+            self._ensure_stream()
         except Exception as e:
-            print(f"Error playing sound: {e}")
-        finally:
-            # Clean up the file after loading
-            if os.path.exists(self.tmpfile.name):
-                os.unlink(self.tmpfile.name)
-                print(f"Temporary file deleted: {self.tmpfile.name}")
-            self.tmpfile = None
+            print(f"Error opening audio stream: {e}")
+            return
+        with self._buffer_lock:
+            # Copy out of the shared scratch buffer: the next worker job
+            # would otherwise overwrite it mid-playback
+            self._loop_buffer = noise.copy()
+            self._play_pos %= len(self._loop_buffer)
+        print("Sound playing")
 
     def update_sound(self):
         if self.playing:
-            # Fade out current sound to avoid pop
-            if self.sound:
-                self.sound.fadeout(100)  # 100ms fadeout for smoother transition
+            # Restarting the timer on every event coalesces a slider drag
+            # into a single rebuild once the events go quiet
+            self._rebuild_timer.start()
+
+    def _rebuild_sound(self):
+        # _on_noise_ready swaps the loop buffer under the stream once ready
+        if self.playing:
             self.play_sound()
             print("Sound updated")
 
     def stop_sound(self):
-        if self.sound:
-            self.sound.fadeout(100)  # Smooth fadeout
-            self.sound = None
-        if self.tmpfile and os.path.exists(self.tmpfile.name):
-            os.unlink(self.tmpfile.name)
-            print(f"Temporary file deleted: {self.tmpfile.name}")
-            self.tmpfile = None
+        with self._buffer_lock:
+            self._loop_buffer = None
+            self._play_pos = 0
+        if self._stream is not None and self._stream.active:
+            self._stream.stop()
 
     def on_tray_activated(self, reason):
         if reason == QSystemTrayIcon.DoubleClick: